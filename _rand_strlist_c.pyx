@@ -0,0 +1,37 @@
+# cython: language_level=3
+"""
+Optional compiled sampling loop for FinderBrowser.rand_strlist (finder4.py).
+Build in place with:
+	cythonize -i _rand_strlist_c.pyx
+finder4 imports this module if present and falls back to the pure-Python
+sampler otherwise. Seed derivation and memoization stay on the Python side;
+this only generates 'count' strings of length n..m from a 32-bit seed.
+All RNG state is local to the call (xorshift32), so concurrent calls from
+thread-pool workers stay deterministic per seed.
+"""
+
+cdef bytes _ALPHABET = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+
+cdef inline unsigned int _next(unsigned int* state):
+	# xorshift32 step; state must never be zero.
+	state[0] ^= state[0] << 13
+	state[0] ^= state[0] >> 17
+	state[0] ^= state[0] << 5
+	return state[0]
+
+
+def rand_strlist(unsigned int seed_int, int n, int m, int count):
+	"""Return a tuple of 'count' random strings, each n..m characters long."""
+	cdef int i, j, length
+	cdef int span = m - n + 1
+	cdef unsigned int state = seed_int if seed_int != 0 else 1
+	cdef bytearray buf
+	result = []
+	for i in range(count):
+		length = n + _next(&state) % span
+		buf = bytearray(length)
+		for j in range(length):
+			buf[j] = _ALPHABET[_next(&state) % 62]
+		result.append(buf.decode("ascii"))
+	return tuple(result)
@@ -10,16 +10,82 @@ Random-Seed Column Browser
 - The main entry point is defined as a static method of the class.
 - Widget size and current path are saved/restored using QSettings.
 """
+import collections
+import functools
 import hashlib
 import random
 import string
 import sys
+import zlib
 
 from PySide6 import QtCore, QtWidgets
 
+# Alphabet used for random string generation, built once at import time.
+_ALPHABET = string.ascii_letters + string.digits
+_ALPHABET_BYTES = _ALPHABET.encode("ascii")
+# 256-entry table folding any byte value onto the alphabet, so a raw random
+# byte string maps to characters in a single bytes.translate pass.
+_TABLE = bytes(_ALPHABET_BYTES[i % 62] for i in range(256))
+
+# Optional compiled sampler (see _rand_strlist_c.pyx, built with cythonize).
+try:
+	from _rand_strlist_c import rand_strlist as _rand_strlist_c
+except ImportError:
+	_rand_strlist_c = None
+
+
+class _GenTask(QtCore.QRunnable):
+	"""
+	Run one generator call on the global thread pool.
+	QRunnable cannot emit signals itself, so the result is reported through
+	a small helper QObject created on the GUI thread; Qt queues the emission
+	back onto the GUI thread automatically.
+	"""
+
+	class Signals(QtCore.QObject):
+		done = QtCore.Signal(int, tuple, tuple)
+
+	def __init__(self, idx, seed, fn):
+		super().__init__()
+		self.idx = idx
+		self.seed = seed
+		self.fn = fn
+		self.signals = _GenTask.Signals()
+
+	def run(self):
+		self.signals.done.emit(self.idx, self.seed, tuple(self.fn(self.seed)))
+
+
+class _ColumnModel(QtCore.QAbstractListModel):
+	"""
+	Minimal read-only list model over a sequence of option strings.
+	The view pulls rows on demand, so populating a column costs O(1)
+	regardless of how many options the generator returned.
+	"""
+
+	def __init__(self, options, parent=None):
+		super().__init__(parent)
+		self._options = options
+
+	def rowCount(self, parent=QtCore.QModelIndex()):
+		return 0 if parent.isValid() else len(self._options)
+
+	def data(self, index, role=QtCore.Qt.DisplayRole):
+		if index.isValid() and role == QtCore.Qt.DisplayRole:
+			return self._options[index.row()]
+		return None
+
+	def row_of(self, text):
+		"""Return the row holding 'text', or -1 if absent."""
+		try:
+			return self._options.index(text)
+		except ValueError:
+			return -1
+
 
 class FinderBrowser(QtWidgets.QWidget):
 	COLUMN_WIDTH = 120
+	OPTIONS_CACHE_MAX = 512
 
 	def __init__(self, fn, parent=None):
 		"""
@@ -36,6 +102,13 @@ class FinderBrowser(QtWidgets.QWidget):
 		self.fns = fn
 		# List to hold column widgets.
 		self.columns = []
+		# Map of column widget -> column index for O(1) click routing.
+		self._col_index = {}
+		# Selection prefix the current columns were built from.
+		self._built_prefix = []
+		# Memo of (column index, seed prefix) -> options, independent of any
+		# caching the generator functions may do themselves.
+		self._options_cache = collections.OrderedDict()
 		# QSettings instance.
 		self.settings = QtCore.QSettings("MyCompany", "RandomSeedColumnBrowser")
 		# Initialize the UI.
@@ -86,58 +159,145 @@ class FinderBrowser(QtWidgets.QWidget):
 
 	def refresh(self):
 		"""
-		Rebuild all columns based on the current selection.
+		Update the columns to match the current selection.
 		For each column index i:
 		  - Use the generator function at index i with seed = self.selection[:i].
 		  - Create a column (QListWidget) and select the item matching self.selection[i] (if any).
 		If the number of selected items is less than the number of generators, add one extra column.
+		Columns whose seed prefix is unchanged since the last refresh are kept as-is;
+		only columns from the first divergence onward are torn down and rebuilt.
 		"""
-		# Remove any existing columns.
-		while self.columns:
-			widget = self.columns.pop()
-			self.hlayout.removeWidget(widget)
-			widget.deleteLater()
-		# Rebuild columns for each already selected item.
-		for i in range(len(self.selection)):
-			seed = self.selection[:i]
-			options = self.fns[i](seed)
-			list_widget = QtWidgets.QListWidget()
-			list_widget.setFixedWidth(self.COLUMN_WIDTH)
-			list_widget.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-			for option in options:
-				item = QtWidgets.QListWidgetItem(option)
-				list_widget.addItem(item)
-			# Try to find and select the item matching the selection.
-			for idx in range(list_widget.count()):
-				if list_widget.item(idx).text() == self.selection[i]:
-					list_widget.setCurrentRow(idx)
-					break
-			list_widget.itemClicked.connect(lambda item, idx=i: self._on_click(idx, item))
-			self.hlayout.addWidget(list_widget)
-			self.columns.append(list_widget)
-		# If we haven't reached the maximum columns, add one more.
-		if len(self.selection) < len(self.fns):
-			seed = self.selection[:]
-			options = self.fns[len(self.selection)](seed)
-			list_widget = QtWidgets.QListWidget()
-			list_widget.setFixedWidth(self.COLUMN_WIDTH)
-			list_widget.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-			for option in options:
-				item = QtWidgets.QListWidgetItem(option)
-				list_widget.addItem(item)
-			list_widget.itemClicked.connect(lambda item, idx=len(self.selection): self._on_click(idx, item))
-			self.hlayout.addWidget(list_widget)
-			self.columns.append(list_widget)
+		target = min(len(self.selection) + 1, len(self.fns))
+		# Longest common prefix between the built columns and the new selection.
+		common = 0
+		while (common < len(self._built_prefix) and common < len(self.selection)
+				and self._built_prefix[common] == self.selection[common]):
+			common += 1
+		# Column i was built from seed selection[:i], so columns 0..common are reusable.
+		keep = min(common + 1, target, len(self.columns))
+		# Suspend repaints so the rebuild triggers a single layout/paint pass.
+		self.columns_container.setUpdatesEnabled(False)
+		try:
+			while len(self.columns) > keep:
+				widget = self.columns.pop()
+				self._col_index.pop(widget, None)
+				self.hlayout.removeWidget(widget)
+				widget.deleteLater()
+			# The boundary column is kept but its highlighted item may have changed.
+			if keep:
+				boundary = self.columns[keep - 1]
+				model = boundary.model()
+				row = -1
+				if keep - 1 < len(self.selection):
+					row = model.row_of(self.selection[keep - 1])
+				with QtCore.QSignalBlocker(boundary):
+					if row >= 0:
+						boundary.setCurrentIndex(model.index(row, 0))
+					else:
+						# No (or no matching) segment: clear any stale highlight.
+						boundary.setCurrentIndex(QtCore.QModelIndex())
+			# Build the missing columns from the divergence point on. Cached
+			# options populate immediately; misses show a placeholder column
+			# and run the generator on the thread pool.
+			for i in range(len(self.columns), target):
+				key = (i, tuple(self.selection[:i]))
+				options = self._cache_get(key)
+				if options is not None:
+					self._make_column(i, options)
+				else:
+					self._make_column(i, ("Loading...",), placeholder=True)
+					task = _GenTask(i, key[1], self.fns[i])
+					task.signals.done.connect(self._on_options_ready)
+					QtCore.QThreadPool.globalInstance().start(task)
+		finally:
+			self.columns_container.setUpdatesEnabled(True)
+		self._built_prefix = self.selection[:]
 		# Update the path display.
 		self.path_lineedit.setText(self.get_path())
 
-	def _on_click(self, col_index, item):
+	def _cache_get(self, key):
+		"""Return memoized options for 'key' (refreshing its LRU slot) or None."""
+		options = self._options_cache.get(key)
+		if options is not None:
+			self._options_cache.move_to_end(key)
+		return options
+
+	def _cache_put(self, key, options):
+		"""Memoize options for 'key', evicting the oldest entry past the cap."""
+		self._options_cache[key] = options
+		if len(self._options_cache) > self.OPTIONS_CACHE_MAX:
+			self._options_cache.popitem(last=False)
+
+	def _on_options_ready(self, idx, seed, options):
+		"""
+		Receive generator output computed on the thread pool. Memoize it and
+		populate column 'idx', unless the selection prefix has changed since
+		the task was started (the result is then kept only in the cache).
+		"""
+		self._cache_put((idx, seed), options)
+		if idx >= len(self.columns) or tuple(self.selection[:idx]) != seed:
+			return
+		view = self.columns[idx]
+		old_model = view.model()
+		model = _ColumnModel(list(options), view)
+		view.setModel(model)
+		if old_model is not None:
+			old_model.deleteLater()
+		view.setEnabled(True)
+		if idx < len(self.selection):
+			row = model.row_of(self.selection[idx])
+			if row >= 0:
+				with QtCore.QSignalBlocker(view):
+					view.setCurrentIndex(model.index(row, 0))
+
+	def _make_column(self, idx, options, placeholder=False):
+		"""
+		Build the column at index 'idx' showing 'options': create a QListView
+		over a lazy _ColumnModel, highlight the item matching the selection
+		(if any), connect the click handler and append it to the layout.
+		A placeholder column is disabled until its real options arrive.
+		Returns the view.
+		"""
+		view = QtWidgets.QListView()
+		view.setFixedWidth(self.COLUMN_WIDTH)
+		view.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+		view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+		# All rows are the same height; one measurement covers the column.
+		view.setUniformItemSizes(True)
+		model = _ColumnModel(list(options), view)
+		view.setModel(model)
+		if placeholder:
+			view.setEnabled(False)
+		# Select the item matching the selection, if present; block signals so
+		# the programmatic highlight doesn't cascade selection handling.
+		elif idx < len(self.selection):
+			row = model.row_of(self.selection[idx])
+			if row >= 0:
+				with QtCore.QSignalBlocker(view):
+					view.setCurrentIndex(model.index(row, 0))
+		view.clicked.connect(self._on_any_click)
+		self.hlayout.addWidget(view)
+		self.columns.append(view)
+		self._col_index[view] = idx
+		return view
+
+	def _on_any_click(self, index):
+		"""Route clicked from any column to _on_click via the sender widget."""
+		idx = self._col_index.get(self.sender())
+		if idx is not None:
+			self._on_click(idx, index)
+
+	def _on_click(self, col_index, index):
 		"""
 		When an item is clicked:
 		  - Update the selection to be the current selection up to col_index plus the clicked item.
 		  - Rebuild the columns.
+		Re-clicking the item that is already the tail of the selection is a no-op.
 		"""
-		self.selection = self.selection[:col_index] + [item.text()]
+		new_selection = self.selection[:col_index] + [index.data()]
+		if new_selection == self.selection:
+			return
+		self.selection = new_selection
 		self.refresh()
 
 	def _on_path_entered(self):
@@ -160,28 +320,45 @@ class FinderBrowser(QtWidgets.QWidget):
 			super().keyPressEvent(event)
 
 	@staticmethod
-	def rand_strlist(seed_list, n=5, m=8, count=10):
+	@functools.lru_cache(maxsize=1024)
+	def rand_strlist(seed_list, n=5, m=8, count=10, use_sha256=False):
 		"""
-		Generate a list of random strings using a list of strings as a seed.
-		The seed list is joined into a single string, hashed, and used to seed the random generator.
+		Generate a tuple of random strings using a tuple of strings as a seed.
+		The seed tuple is joined into a single string, hashed with crc32 (cheap,
+		non-cryptographic) and used to seed the random generator.
 		Each string has a random length between n and m (defaults: 5 and 8).
-		:param seed_list: List of strings used as seed.
+		Results are memoized per (seed, n, m, count), so revisiting a seed is a dict lookup.
+		:param seed_list: Tuple of strings used as seed (must be hashable for the cache).
 		:param n: Minimum string length.
 		:param m: Maximum string length.
 		:param count: Number of strings to generate.
-		:return: List of random strings.
+		:param use_sha256: Use the old SHA-256 seeding, for reproducibility with prior seeds.
+		:return: Tuple of random strings.
 		"""
-		if not isinstance(seed_list, list):
-			seed_list = [str(seed_list)]
+		if not isinstance(seed_list, tuple):
+			seed_list = (str(seed_list),)
 		seed_str = "".join(seed_list)
-		seed_int = int(hashlib.sha256(seed_str.encode("utf-8")).hexdigest(), 16) % (2**32)
-		random.seed(seed_int)
+		if use_sha256:
+			seed_int = int(hashlib.sha256(seed_str.encode("utf-8")).hexdigest(), 16) % (2**32)
+		else:
+			seed_int = zlib.crc32(seed_str.encode("utf-8"))
+		# Use the compiled sampler when the extension is built.
+		if _rand_strlist_c is not None:
+			return _rand_strlist_c(seed_int, n, m, count)
+		# A local instance keeps the process-wide random module state untouched
+		# and guarantees the same seed always yields the same strings.
+		rng = random.Random(seed_int)
+		lengths = [rng.randint(n, m) for _ in range(count)]
+		total = sum(lengths)
+		# Draw all bytes at once and fold them onto the alphabet in a single
+		# C-level translate pass (the tiny modulo bias is fine for demo data).
+		buf = rng.randbytes(total).translate(_TABLE).decode("ascii")
 		result = []
-		for _ in range(count):
-			length = random.randint(n, m)
-			s = "".join(random.choices(string.ascii_letters + string.digits, k=length))
-			result.append(s)
-		return result
+		off = 0
+		for length in lengths:
+			result.append(buf[off:off + length])
+			off += length
+		return tuple(result)
 
 	def load_settings(self):
 		"""Restore widget size and current path from QSettings."""
@@ -208,9 +385,9 @@ class FinderBrowser(QtWidgets.QWidget):
 		app = QtWidgets.QApplication(sys.argv)
 
 		def gen_random_entries(seed):
-			if not isinstance(seed, list):
+			if not isinstance(seed, (list, tuple)):
 				seed = [str(seed)]
-			return FinderBrowser.rand_strlist(seed, n=5, m=8, count=10)
+			return FinderBrowser.rand_strlist(tuple(seed), n=5, m=8, count=10)
 
 		# Provide a list of generator functions (one per column).
 		fn_list = [gen_random_entries] * 7